@@ -3,9 +3,12 @@ import pygame
 
 WINDOW_WIDTH = 1500
 WINDOW_HEIGHT = 750
+FRAME_RATE = 30
 RACK_SIZE = (850, 80)
 BG_TEXT = ("RUMMIKUB GAME", (0, 0, 0), None)
 LINE_COLOR = (193, 154, 107)
+HOVER_COLOR = (36, 160, 237, 30)
+CLICK_HIGHLIGHT_COLOR = (36, 160, 237, 120)
 GRID_WIDTH = 52
 GRID_HEIGHT = 73
 GRID_COLOR_DARK = (0, 0, 255)
@@ -32,9 +35,11 @@ YELLOW_TILES_PATH = {i: "images/tiles/1-15 YELLOW/YELLOW_5_{0}.png".format(i) fo
 PERMUTATIONS = []
 OCCUPIED_SPACE = {}
 BOX_TILES = {}
-IMG_PATHS = [ADD_CARDS_PATH, REARRANGE_TILES_ICON_PATH, MENU_ICON_PATH, CHECK_LOGIC_BUTTON]
+IMG_PATHS = {ADD_CARDS_PATH, REARRANGE_TILES_ICON_PATH, MENU_ICON_PATH, CHECK_LOGIC_BUTTON}
 TILES_IMAGES_PATHS = [BLACK_TILES_PATH, BLUE_TILES_PATH, GREEN_TILES_PATH, RED_TILES_PATH, YELLOW_TILES_PATH]
 
 PLAYER_1 = {}
 PLAYER_2 = {}
 PLAYERS = [PLAYER_1, PLAYER_2]
+# Number and color of every dealt tile
+TILE_META = {}
@@ -5,7 +5,8 @@ from rummikub_game import RummikubGame
 
 
 def main():
-    game = RummikubGame(pygame.display.set_mode((images_path.WINDOW_WIDTH, images_path.WINDOW_HEIGHT)))
+    game = RummikubGame(pygame.display.set_mode((images_path.WINDOW_WIDTH, images_path.WINDOW_HEIGHT),
+                                                pygame.DOUBLEBUF))
     if "Exit" == game.game_status():
         sys.exit()
 
@@ -1,8 +1,6 @@
 from __future__ import annotations
-import copy
 import random
-import re
-import sys
+from collections import defaultdict
 from typing import Tuple, Union
 
 import pygame.mouse
@@ -12,6 +10,9 @@ from pygame.rect import RectType
 from surface_info import *
 from draw_grids import *
 
+_TILE_COLORS = frozenset(("BLACK", "BLUE", "GREEN", "RED", "YELLOW"))
+_COLOR_INDEX = {"black": 0, "blue": 1, "green": 2, "red": 3, "yellow": 4}
+
 
 def set_text_transparency(font_value, transparency, coordinates=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)):
     """
@@ -66,18 +67,15 @@ def update_score(rack_size, rack_coordinates):
     This function iterates through the tiles in PLAYER_1 and removes those that are not within the specified rack area.
     The rack area is determined by the provided rack size and coordinates.
     """
-    key_deletion = []
-
-    for key, value in PLAYER_1.items():
-        if isinstance(value, list):  # Check if value is a list or tuple
-            x, y = value[1][0], value[1][1]
-            rack_x = (WINDOW_WIDTH // 2 - rack_size[0] // 2)
-            rack_y = (WINDOW_HEIGHT - rack_size[1] * 2 + rack_size[1])
+    rack_x = (WINDOW_WIDTH // 2 - rack_size[0] // 2)
+    rack_y = (WINDOW_HEIGHT - rack_size[1] * 2 + rack_size[1])
+    left, right = rack_coordinates[0], rack_x + rack_size[0]
+    top, bottom = rack_coordinates[1] - rack_size[1], rack_y + rack_size[1]
 
-            # Check if the tile is outside the rack area and marked for deletion
-            if "1-15" in key and (x not in range(rack_coordinates[0], rack_x + rack_size[0]) or
-                                  y not in range(rack_coordinates[1] - rack_size[1], rack_y + rack_size[1])):
-                key_deletion.append(key)
+    # Collect the tiles outside the rack area
+    key_deletion = [key for key, value in PLAYER_1.items()
+                    if isinstance(value, list) and key in TILE_META and
+                    not (left <= value[1][0] < right and top <= value[1][1] < bottom)]
 
     # Delete tiles marked for deletion
     for key in key_deletion:
@@ -94,9 +92,9 @@ def extract_last_number_from_filename(filename: str) -> int:
     Returns:
     int: The extracted last number.
     """
-    match = re.search(r'_(\d+).png', filename)
-    if match:
-        return int(match.group(1))
+    number = filename[filename.rfind('_') + 1:-4]
+    if filename.endswith('.png') and number.isdigit():
+        return int(number)
     return 0
 
 
@@ -110,12 +108,89 @@ def extract_color_from_filename(filename: str) -> str:
     Returns:
     str: The extracted color.
     """
-    match = re.search(r'images\\tiles\\1-15 (BLACK|BLUE|GREEN|RED|YELLOW)_\d+_\d+.png', filename)
-    if match:
-        return match.group(1).lower()
+    name = filename[filename.rfind('/') + 1:]
+    color = name[:name.find('_')]
+    if color in _TILE_COLORS:
+        return color.lower()
     return ''
 
 
+def find_free_board_position(occupancy, run_length=6):
+    """
+    Find where to start placing a new set of tiles on the board.
+
+    Parameters:
+    - occupancy (list): One list of booleans per board row, True where a tile sits.
+    - run_length (int): The number of consecutive free cells needed in one row.
+
+    Returns:
+    tuple | None: The (x, y) position of the first tile, or None if no row has enough free cells.
+
+    Each row is walked once, counting the free cells since the last occupied one.
+    Unless the first long enough run starts at the left edge of the board, its first cell is skipped so the new set
+    stays separated from the tiles before it.
+    """
+    for row_index, row in enumerate(occupancy):
+        run_size = 0
+        for column_index, is_occupied in enumerate(row):
+            run_size = 0 if is_occupied else run_size + 1
+
+            if run_size == run_length:
+                start_column = column_index - run_length + 1
+                c_x = BIG_BOX_POSITION[0] + start_column * 52
+                c_y = BIG_BOX_POSITION[1] + row_index * 73
+                if start_column != 0:
+                    return c_x + 52, c_y
+                return c_x, c_y
+
+    return None
+
+
+def register_tile_meta(tile_path: str) -> tuple[int, str]:
+    """
+    Parse the number and color of a tile once and store them in TILE_META.
+
+    Parameters:
+    - tile_path (str): The path of the tile image.
+
+    Returns:
+    tuple[int, str]: The tile number and color.
+    """
+    tile_meta = TILE_META.get(tile_path)
+    if tile_meta is None:
+        tile_meta = (extract_last_number_from_filename(tile_path), extract_color_from_filename(tile_path))
+        TILE_META[tile_path] = tile_meta
+    return tile_meta
+
+
+def validate_tile_set(numbers, colors):
+    """
+    Check whether a set of tiles forms a valid group or a valid run.
+
+    Parameters:
+    - numbers (Sequence[int]): The tile numbers, in board order.
+    - colors (Sequence[str]): The tile colors, in the same order as numbers.
+
+    Returns:
+    tuple[bool, bool]: Whether the tiles form a group and whether they form a run.
+
+    A group shares the number of the first tile while every other tile has a different color from it.
+    A run keeps the color of the first tile with strictly increasing numbers of a single parity.
+    Both rules are checked together in one pass over the tiles.
+    """
+    first_number, first_color = numbers[0], colors[0]
+    is_group = is_run = True
+
+    for index in range(1, len(numbers)):
+        number, color = numbers[index], colors[index]
+        if number != first_number or color == first_color:
+            is_group = False
+        if color != first_color or number <= numbers[index - 1] or (number - first_number) % 2:
+            is_run = False
+
+    return is_group, is_run
+
+
 def identify_rummikub_runs(player):
     """
     Identify Rummikub runs (sequences of consecutive numbers) in a player's tiles.
@@ -128,80 +203,55 @@ def identify_rummikub_runs(player):
           Each run consists of tile keys that form a consecutive sequence of numbers.
 
     This function analyzes a player's tiles to identify and return Rummikub runs.
-    It groups tiles by color and then looks for consecutive number sequences within each color group.
+    Each tile is encoded as a single integer (color index * 32 + number), so one sort orders the tiles by color
+    and number, and a step of exactly 2 between neighbouring codes can only occur inside one color.
     The result is a list of runs, where each run is represented by a list of tile keys forming a sequence.
     """
-    tile_keys = [key for key in player.keys() if 'images/tiles/1-15' in key]
-    color_groups = {}
-
-    for key in tile_keys:
-        color = key.split('/')[-1].split('_')[0]
-        if color not in color_groups:
-            color_groups[color] = []
-        color_groups[color].append(key)
-
+    coded_tiles = sorted((_COLOR_INDEX[TILE_META[key][1]] * 32 + TILE_META[key][0], key)
+                         for key in player if key in TILE_META)
     runs = []
+    current_run = []
 
-    for color, tiles in color_groups.items():
-        tiles.sort(key=extract_last_number_from_filename)
-        current_run = []
-
-        for i in range(len(tiles) - 1):
-            current_number = int(extract_last_number_from_filename(tiles[i]))
-            next_number = int(extract_last_number_from_filename(tiles[i + 1]))
-
-            if next_number - current_number == 2:
-                if tiles[i] not in current_run:
-                    current_run.append(tiles[i])
-                current_run.append(tiles[i + 1])
-            else:
-                if len(current_run) >= 2:
-                    runs.append(current_run)
-                current_run = []
+    for (code, key), (next_code, next_key) in zip(coded_tiles, coded_tiles[1:]):
+        if next_code - code == 2:
+            if not current_run:
+                current_run.append(key)
+            current_run.append(next_key)
+        else:
+            if len(current_run) >= 2:
+                runs.append(current_run)
+            current_run = []
 
-        if len(current_run) >= 2:
-            runs.append(current_run)
+    if len(current_run) >= 2:
+        runs.append(current_run)
 
     return runs
 
 
 def identify_rummikub_groups(values):
     """
-    Identify Rummikub groups (sets of tiles with the same number and color) in PLAYER_1's tiles.
+    Identify Rummikub groups (sets of tiles with the same number in different colors) in a player's tiles.
+
+    Parameters:
+    - values (dict): A dictionary representing a player's tiles.
 
     Returns:
     list: A list of lists where each inner list represents a Rummikub group.
-          Each group consists of tile keys that share the same number and color.
+          Each group consists of tile keys that share the same number in different colors.
 
-    This function examines PLAYER_1's tiles to identify and return Rummikub groups.
-    It iterates through the tiles, identifying sets of tiles with the same number and color.
+    This function examines the given tiles to identify and return Rummikub groups.
+    It buckets the tiles by number in a single pass; since every number/color tile is unique, each bucket holds
+    tiles of the same number in different colors.
     The result is a list of groups, where each group is represented by a list of tile keys sharing the same number
-    and color.
+    in different colors.
     """
-    groups = []
-    seen_tiles = set()
-
-    for key, value in values.items():
-        if 'images/tiles/1-15' in key and key not in seen_tiles:
-            number = extract_last_number_from_filename(key)
-            color = extract_color_from_filename(key)
-
-            group = [key]
-            seen_tiles.add(key)
-
-            for other_key, other_value in PLAYER_1.items():
-                if 'images/tiles/1-15' in other_key and other_key not in seen_tiles:
-                    other_number = extract_last_number_from_filename(other_key)
-                    other_color = extract_color_from_filename(other_key)
+    buckets = defaultdict(list)
 
-                    if number == other_number and color == other_color:
-                        group.append(other_key)
-                        seen_tiles.add(other_key)
+    for key in values:
+        if key in TILE_META:
+            buckets[TILE_META[key][0]].append(key)
 
-            if len(list(set(group))) >= 2:
-                groups.append(group)
-
-    return groups
+    return [group for group in buckets.values() if len(group) >= 2]
 
 
 class RummikubGame:
@@ -210,8 +260,32 @@ class RummikubGame:
         self.image_database = {}
         self.font_database = {}
         self.game_object_database = {}
-        self.DEFAULT_TILE_POSITIONS = tuple()
+        self.tiles_1_15 = {}
+        self.DEFAULT_TILE_POSITIONS = []
+        self.game_object_cache = None
+        self.tile_lists_cache = None
+        self.blit_cache = None
+        self.hover_zones_cache = None
+        self.static_background = None
+        self.needs_redraw = True
+        self.highlight_rects = []
+        self.running = False
+        self.available_tiles = {path for tile_paths in TILES_IMAGES_PATHS for path in tile_paths.values()}
         pygame.font.init()  # Initialize the font module
+        self.ui_font = pygame.font.Font(FONT_PATH, 36)
+        self.player_2_label = self.ui_font.render("PLAYER 2 :=", True, (255, 255, 255))
+        self.player_2_label_rect = self.player_2_label.get_rect(topleft=(50, WINDOW_HEIGHT - 200))
+        self.menu_cache = None
+        self.transparency_surfaces = {}
+        self.event_dispatch = {
+            pygame.QUIT: self.handle_quit_event,
+            pygame.MOUSEBUTTONUP: self.handle_click_event,
+            pygame.MOUSEMOTION: self.handle_motion_event,
+            pygame.VIDEOEXPOSE: self.handle_expose_event,
+            pygame.WINDOWEXPOSED: self.handle_expose_event,
+            pygame.WINDOWRESTORED: self.handle_expose_event,
+            pygame.WINDOWSHOWN: self.handle_expose_event,
+        }
 
     def initialize_window(self) -> None:
         """
@@ -221,13 +295,15 @@ class RummikubGame:
         None
         """
         pygame.init()
+        self.clock = pygame.time.Clock()
         pygame.display.set_caption("Rummikub Game")
         pygame.display.set_icon(self.load_image(ICON_PATH)[0][0])
 
     def load_image(self, image_path: str, coordinates: Tuple[int, int] = None, size: Tuple[int, int] = None) -> \
             tuple[tuple[Surface | SurfaceType, Rect | RectType], str]:
         """
-        Load an image from the specified path.
+        Load an image from the specified path, reusing the surface already stored in image_database.
+        Newly loaded images are converted to the display pixel format once so later blits stay fast.
 
         Parameters:
         - image_path (str): The path to the image file.
@@ -237,19 +313,21 @@ class RummikubGame:
         Returns:
         Tuple[Surface | SurfaceType, str]: The loaded image and its path.
         """
-        loaded_image = pygame.image.load(image_path)
-        is_none = coordinates is not None and size is not None
+        cached = self.image_database.get(image_path)
+        if cached is not None and (coordinates is None or size is None):
+            return (cached[0], cached[0].get_rect()), image_path
 
-        if is_none and image_path not in self.image_database:
-            image_rect = loaded_image.get_rect()
-            image_rect.x = coordinates[0]
-            image_rect.y = coordinates[1]
-            self.image_database[image_path] = (loaded_image, copy.deepcopy(list(coordinates)), size, image_rect)
-        elif is_none and image_path in self.image_database:
+        if cached is not None:
+            loaded_image = cached[0]
+        else:
+            loaded_image = pygame.image.load(image_path).convert_alpha()
+
+        if coordinates is not None and size is not None:
             image_rect = loaded_image.get_rect()
             image_rect.x = coordinates[0]
             image_rect.y = coordinates[1]
-            self.image_database[image_path] = (loaded_image, copy.deepcopy(list(coordinates)), size, image_rect)
+            self.image_database[image_path] = (loaded_image, [coordinates[0], coordinates[1]], size, image_rect)
+            self.hover_zones_cache = None
         return (loaded_image, loaded_image.get_rect()), image_path
 
     def load_font(self, font_path: str, text: Tuple[str, Tuple[int, int, int], Union[None, Tuple[int, int, int]]],
@@ -271,7 +349,41 @@ class RummikubGame:
         self.font_database[FONT_PATH] = set_font_rend
         return set_font_rend
 
-    def set_image_transparency(self, color: Tuple[int, int, int, int], rect: Tuple[int, int, int, int]):
+    def set_tile_object(self, key: str, value: tuple[Surface | SurfaceType, Rect | RectType]) -> None:
+        """
+        Store a tile in the game_object_database and keep the tiles_1_15 index in sync.
+
+        Parameters:
+        - key (str): The path of the tile image.
+        - value (tuple[Surface | SurfaceType, Rect | RectType]): The tile surface and its rect object.
+
+        Returns:
+        None
+        """
+        self.game_object_database[key] = value
+        self.tiles_1_15[key] = value
+        self.tile_lists_cache = None
+        self.blit_cache = None
+        self.hover_zones_cache = None
+
+    def get_tile_lists(self):
+        """
+        Get the keys of the tiles that can be moved, their stored image_database entries and their rect objects.
+
+        Returns:
+        tuple: The tile keys, the matching image_database values and the tile rect objects, in the same order.
+
+        The lists are built once and cached until set_tile_object stores a tile again.
+        The rect objects are moved in place, so the cached list always holds the current tile positions.
+        """
+        if self.tile_lists_cache is None:
+            tile_keys = tuple(self.tiles_1_15)
+            self.tile_lists_cache = (tile_keys,
+                                     tuple(self.image_database[key] for key in tile_keys),
+                                     [self.tiles_1_15[key][1] for key in tile_keys])
+        return self.tile_lists_cache
+
+    def set_image_transparency(self, color: Tuple[int, int, int, int], rect: Tuple[int, int, int, int]) -> Rect:
         """
         Draw a transparent rectangle on the display surface.
 
@@ -280,12 +392,18 @@ class RummikubGame:
         - rect (Tuple[int, int, int, int]): The coordinates and size of the rectangle.
 
         Returns:
-        None
+        pygame.Rect: The area of the display surface that was drawn over.
+
+        One SRCALPHA surface is kept per rectangle size and refilled with the color, since hovering redraws the
+        same few overlays on every mouse motion event.
         """
-        shape_surf = pygame.Surface(pygame.Rect(rect).size, pygame.SRCALPHA)
-        pygame.draw.rect(shape_surf, color, shape_surf.get_rect())
-        self.display_surface.blit(shape_surf, rect)
-        return
+        size = pygame.Rect(rect).size
+        shape_surf = self.transparency_surfaces.get(size)
+        if shape_surf is None:
+            shape_surf = pygame.Surface(size, pygame.SRCALPHA)
+            self.transparency_surfaces[size] = shape_surf
+        shape_surf.fill(color)
+        return self.display_surface.blit(shape_surf, rect)
 
     def get_game_object(self):
         """
@@ -298,7 +416,11 @@ class RummikubGame:
         The sizes dictionary contains dimensions for different game elements.
         The coordinates dictionary contains positions for placing game elements on the display surface.
         The images tuple contains paths to various game-related images.
+        The result only depends on the display surface size, so it is computed once and cached.
         """
+        if self.game_object_cache is not None:
+            return self.game_object_cache
+
         default_button_size = self.load_image(ADD_CARDS_PATH)[0][0].get_width()
         SIZE = {"background_image": self.display_surface.get_size(), "brown_rack_image_tile1": RACK_SIZE,
                 "brown_rack_image_tile2": (RACK_SIZE[0] - 10, RACK_SIZE[1]),
@@ -326,7 +448,8 @@ class RummikubGame:
 
         IMAGES = (BG_IMAGE_PATH, TABLE_IMAGE_PATH, TABLE_IMAGE_PATH,
                   ADD_CARDS_PATH, CHECK_LOGIC_BUTTON, REARRANGE_TILES_ICON_PATH, MENU_ICON_PATH, FONT_PATH)
-        return SIZE, COORDINATES, IMAGES
+        self.game_object_cache = (SIZE, COORDINATES, IMAGES)
+        return self.game_object_cache
 
     def set_game_object(self) -> dict:
         """
@@ -354,6 +477,10 @@ class RummikubGame:
                 loaded_text = self.load_font(path, BG_TEXT, size[s])
                 self.game_object_database[s] = (set_text_transparency(loaded_text, 50))
 
+        # Compose the static objects into one background surface
+        self.static_background = pygame.Surface(self.display_surface.get_size()).convert()
+        self.static_background.blits(list(self.game_object_database.values()), doreturn=False)
+        self.blit_cache = None
         return self.game_object_database
 
     def draw_initial_tiles(self, tile_image_list, players_database):
@@ -369,22 +496,20 @@ class RummikubGame:
 
         This method randomly draws tiles for each player in the players_database
         from the provided tile_image_list until each player has 15 tiles.
-        It ensures that each tile drawn is unique by checking its presence in a temporary list.
+        It ensures that each tile drawn is unique by dealing from a shuffled pool of all tiles.
         """
-        random_tile_temp = []
+        tile_pool = [(color_index, number)
+                     for color_index in range(len(tile_image_list))
+                     for number in range(1, len(tile_image_list[0]) + 1)]
+        random.shuffle(tile_pool)
         for players in players_database:
-            while len(players) != 15:
-                random_tile = (
-                    random.randint(0, len(tile_image_list) - 1),
-                    random.randint(1, len(tile_image_list[0]))
-                )
-                is_present = str(random_tile[0]) + str(random_tile[1])
-
-                if is_present not in random_tile_temp:
-                    random_tile_temp.append(is_present)
-                    tile_image_path = tile_image_list[random_tile[0]][random_tile[1]]
-                    tile_image = self.load_image(tile_image_path)
-                    players[tile_image[1]] = list(tile_image[0])
+            while len(players) < 15 and tile_pool:
+                color_index, number = tile_pool.pop()
+                tile_image_path = tile_image_list[color_index][number]
+                self.available_tiles.discard(tile_image_path)
+                register_tile_meta(tile_image_path)
+                tile_image = self.load_image(tile_image_path)
+                players[tile_image[1]] = list(tile_image[0])
         return players_database
 
     def place_initial_tiles(self, player_tiles, rack_size, rack_coordinates):
@@ -407,14 +532,13 @@ class RummikubGame:
             for key, value in tile_value.items():
                 tile_image = self.load_image(key, (c_x, c_y), (52, 73))
 
-                if value not in IMG_PATHS:
-                    IMG_PATHS.append(copy.deepcopy(key))
+                IMG_PATHS.add(key)
                 surface_info = SurfaceInfo(tile_image[1], (c_x, c_y), (52, 73))
                 recreated_surface = recreate_surface(surface_info)
-                self.game_object_database[key] = recreated_surface
+                self.set_tile_object(key, recreated_surface)
                 PLAYER_1[key] = list(recreated_surface)
-                rect_copy = copy.deepcopy(recreated_surface[1])
-                self.DEFAULT_TILE_POSITIONS += ((key, rect_copy),)
+                rect_copy = recreated_surface[1].copy()
+                self.DEFAULT_TILE_POSITIONS.append((key, rect_copy))
                 c_x += 52 + 10
 
                 if (c_x + 52) > (rack_size[0] + rack_coordinates[0]):
@@ -432,59 +556,34 @@ class RummikubGame:
         None
 
         This method generates a new tile and adds it to the player's rack.
-        It ensures that the new tile is unique and satisfies placement conditions.
+        The new tile is picked from the tiles that have not been dealt yet, so it is always unique.
         The method updates relevant game data structures and triggers AI turn.
         """
         last_key, last_value = list(PLAYER_1.items())[-1]
-        random_tile_temp = []
-        tile_image_list = TILES_IMAGES_PATHS
         TILE_MARGIN_X = 10
-        color = ["BLACK", "BLUE", "GREEN", "RED", "YELLOW"]
         new_tile_position = [
             last_value[1][0] + 52 + TILE_MARGIN_X,
             last_value[1][1]
         ]
 
-        while True:
-            random_tile = (
-                random.randint(1, len(tile_image_list) - 1),
-                random.randint(1, len(tile_image_list[0]))
-            )
-
-            tile_image_path = "images/tiles/1-15 {}/{}_{}_{}.png".format(
-                color[random_tile[0] - 1],
-                color[random_tile[0] - 1],
-                random_tile[0],
-                random_tile[1]
-            )
-            if new_tile_position[0] > rack_size[0] + 273:
-                new_tile_position[0] = self.game_object_database["brown_rack_image_tile1"][1][0] + TILE_MARGIN_X
-                new_tile_position[1] = last_value[1][1] + rack_size[1]
-            if (tile_image_path in IMG_PATHS or tile_image_path in PLAYER_2 or
-                    tile_image_path in self.game_object_database.keys()):
-                continue
-
-            if (tile_image_path not in IMG_PATHS or tile_image_path not in self.game_object_database.keys() or
-                    tile_image_path not in PLAYER_2 or
-                    new_tile_position[1] > new_tile_position[1] + rack_size[1] * 2):
-                break
-        is_satisfied = (new_tile_position[0] < rack_size[0] + 273 and
-                        tile_image_path not in PLAYER_2 and
-                        tile_image_path not in IMG_PATHS and
-                        tile_image_path not in self.game_object_database.keys() and
-                        new_tile_position[1] < new_tile_position[1] + rack_size[1] * 2)
+        if new_tile_position[0] > rack_size[0] + 273:
+            new_tile_position[0] = self.game_object_database["brown_rack_image_tile1"][1][0] + TILE_MARGIN_X
+            new_tile_position[1] = last_value[1][1] + rack_size[1]
+
+        is_satisfied = new_tile_position[0] < rack_size[0] + 273 and len(self.available_tiles) > 0
         if is_satisfied:
-            is_present = str(random_tile[0]) + str(random_tile[1])
-            random_tile_temp.append(is_present)
+            tile_image_path = random.choice(tuple(self.available_tiles))
+            self.available_tiles.remove(tile_image_path)
+            register_tile_meta(tile_image_path)
 
             # Load the new tile image
             tile_image = self.load_image(tile_image_path, (new_tile_position[0], new_tile_position[1]), (52, 73))
             # Update IMG_PATHS
-            IMG_PATHS.append(tile_image_path)
+            IMG_PATHS.add(tile_image_path)
 
             recreated_surface = resize_image(tile_image, (52, 73), new_tile_position)
-            self.game_object_database["{0}".format(tile_image_path)] = recreated_surface
-            PLAYER_1["{0}".format(tile_image_path)] = list(recreated_surface)
+            self.set_tile_object(tile_image_path, recreated_surface)
+            PLAYER_1[tile_image_path] = list(recreated_surface)
             self.play_ai_turn(True)
             self.update_blit()
 
@@ -501,7 +600,9 @@ class RummikubGame:
         This method rearranges tiles in the player's rack based on the specified groups.
         It updates the positions of tiles in the game_object_database and image_database.
         """
-        rack_coordinates = self.get_game_object()[1]["brown_rack_image_tile2"]
+        size, coordinates, _ = self.get_game_object()
+        rack_coordinates = coordinates["brown_rack_image_tile2"]
+        rack_right = rack_coordinates[0] + size["brown_rack_image_tile2"][0]
         c_x, c_y = rack_coordinates[0] + 5, rack_coordinates[1]
         non_group_positions = []
 
@@ -510,21 +611,21 @@ class RummikubGame:
                 for key in group:
                     tile_image, _ = self.game_object_database[key]
                     new_tile_position = pygame.Rect(c_x, c_y, tile_image.get_width(), tile_image.get_height())
-                    self.game_object_database[key] = (tile_image, new_tile_position)
-                    self.image_database[key] = (tile_image, copy.deepcopy([c_x, c_y]), (52, 73), new_tile_position)
+                    self.set_tile_object(key, (tile_image, new_tile_position))
+                    self.image_database[key] = (tile_image, [c_x, c_y], (52, 73), new_tile_position)
                     c_x += tile_image.get_width() + 10
                 non_group_positions.append((c_x, c_y))
             c_x, c_y = non_group_positions[-1]
 
+        grouped_tiles = {tile for group in groups for tile in group}
         for key, (tile_image, _) in PLAYER_1.items():
-            if 'images/tiles/1-15' in key and key not in [tile for group in groups for tile in group]:
+            if key in TILE_META and key not in grouped_tiles:
                 new_tile_position = pygame.Rect(c_x, c_y, tile_image.get_width(), tile_image.get_height())
-                self.game_object_database[key] = (tile_image, new_tile_position)
-                self.image_database[key] = (tile_image, copy.deepcopy([c_x, c_y]), (52, 73), new_tile_position)
+                self.set_tile_object(key, (tile_image, new_tile_position))
+                self.image_database[key] = (tile_image, [c_x, c_y], (52, 73), new_tile_position)
                 c_x += tile_image.get_width() + 10
 
-                if (c_x + tile_image.get_width()) > (
-                        rack_coordinates[0] + self.get_game_object()[0]["brown_rack_image_tile2"][0]):
+                if (c_x + tile_image.get_width()) > rack_right:
                     c_x, c_y = rack_coordinates[0] + 5, c_y + tile_image.get_height() + 10
 
         self.update_blit()
@@ -543,33 +644,35 @@ class RummikubGame:
         This method rearranges tiles in the player's rack based on the specified runs.
         It updates the positions of tiles in the game_object_database and image_database.
         """
-        rack_coordinates = self.get_game_object()[1]["brown_rack_image_tile2"]
+        size, coordinates, _ = self.get_game_object()
+        rack_coordinates = coordinates["brown_rack_image_tile2"]
+        rack_right = rack_coordinates[0] + size["brown_rack_image_tile2"][0]
         c_x, c_y = rack_coordinates[0] + 5, rack_coordinates[1]
         non_run_positions = []
 
         if runs:
             runs = [tile for run in runs for tile in run]
-            runs.sort(key=extract_last_number_from_filename)
+            runs.sort(key=lambda tile: TILE_META[tile][0])
 
             for key in runs:
                 tile_image, placeholder = self.game_object_database[key]
                 new_tile_position = pygame.Rect(c_x, c_y, tile_image.get_width(), tile_image.get_height())
-                self.game_object_database[key] = (tile_image, new_tile_position)
-                self.image_database[key] = (tile_image, copy.deepcopy([c_x, c_y]), (52, 73), new_tile_position)
+                self.set_tile_object(key, (tile_image, new_tile_position))
+                self.image_database[key] = (tile_image, [c_x, c_y], (52, 73), new_tile_position)
                 c_x += tile_image.get_width() + 10
 
             non_run_positions.append((c_x, c_y))
             c_x, c_y = non_run_positions[-1]
 
+            run_tiles = set(runs)
             for key, (tile_image, _) in PLAYER_1.items():
-                if 'images/tiles/1-15' in key and key not in runs:
+                if key in TILE_META and key not in run_tiles:
                     new_tile_position = pygame.Rect(c_x, c_y, tile_image.get_width(), tile_image.get_height())
-                    self.game_object_database[key] = (tile_image, new_tile_position)
-                    self.image_database[key] = (tile_image, copy.deepcopy([c_x, c_y]), (52, 73), new_tile_position)
+                    self.set_tile_object(key, (tile_image, new_tile_position))
+                    self.image_database[key] = (tile_image, [c_x, c_y], (52, 73), new_tile_position)
                     c_x += tile_image.get_width() + 10
 
-                    if (c_x + tile_image.get_width()) > (
-                            rack_coordinates[0] + self.get_game_object()[0]["brown_rack_image_tile2"][0]):
+                    if (c_x + tile_image.get_width()) > rack_right:
                         c_x, c_y = rack_coordinates[0] + 5, c_y + tile_image.get_height() + 10
 
             self.update_blit()
@@ -582,37 +685,39 @@ class RummikubGame:
         Returns:
         None
 
-        This method selects a random tile image from TILES_IMAGES_PATHS, creates a unique tile image path,
-        and adds the tile to the AI's rack (PLAYER_2) if it's not already present in PLAYER_1 or PLAYER_2.
+        This method picks a random tile from the tiles that have not been dealt yet, so it is always unique,
+        and adds it to the AI's rack (PLAYER_2). Nothing is added once every tile has been dealt.
         """
-        tile_image_list = TILES_IMAGES_PATHS
-        color = ["BLACK", "BLUE", "GREEN", "RED", "YELLOW"]
+        if not self.available_tiles:
+            return
 
-        while True:
-            random_tile = (
-                random.randint(1, len(tile_image_list) - 1),
-                random.randint(1, len(tile_image_list[0]))
-            )
-
-            tile_image_path = "images/tiles/1-15 {}/{}_{}_{}.png".format(
-                color[random_tile[0] - 1],
-                color[random_tile[0] - 1],
-                random_tile[0],
-                random_tile[1]
-            )
-
-            if (tile_image_path in self.game_object_database.keys() or tile_image_path in PLAYER_2 or
-                    tile_image_path in PLAYER_1):
-                continue
-
-            if (tile_image_path not in self.game_object_database.keys() or tile_image_path not in PLAYER_2 or
-                    tile_image_path not in PLAYER_1):
-                break
-
-        if (tile_image_path not in PLAYER_2 and tile_image_path not in PLAYER_1 and
-                tile_image_path not in self.game_object_database.keys()):
-            tile_image = self.load_image(tile_image_path, (0, 0), (52, 73))
-            PLAYER_2[tile_image[1]] = tile_image[0]
+        tile_image_path = random.choice(tuple(self.available_tiles))
+        self.available_tiles.discard(tile_image_path)
+        register_tile_meta(tile_image_path)
+        tile_image = self.load_image(tile_image_path, (0, 0), (52, 73))
+        PLAYER_2[tile_image[1]] = tile_image[0]
+
+    def calculate_board_occupancy(self):
+        """
+        Build an occupancy grid of the board cells covered by placed tiles.
+
+        Returns:
+        list: One list of booleans per board row, True where a tile sits.
+
+        The grid has one cell per 52x73 slot of the big box. Tiles are looked up through the tiles_1_15 index and
+        marked at their last confirmed position stored in image_database.
+        """
+        left, top = BIG_BOX_POSITION
+        column_count = len(range(left, left + BIG_BOX_WIDTH, 52))
+        row_count = len(range(top, top + BIG_BOX_HEIGHT, 73))
+        occupancy = [[False] * column_count for _ in range(row_count)]
+
+        for key in self.tiles_1_15:
+            x, y = self.image_database[key][1]
+            if left <= x < left + BIG_BOX_WIDTH and top <= y < top + BIG_BOX_HEIGHT:
+                occupancy[(y - top) // 73][(x - left) // 52] = True
+
+        return occupancy
 
     def play_ai_turn(self, is_delete=False):
         """
@@ -631,71 +736,22 @@ class RummikubGame:
         If is_delete is True, delete tiles played during the turn from the AI's rack.
         If there are no playable tiles in even or odd sequences, the AI draws a new tile.
         """
-        card_number = {}
-        for key, value in PLAYER_2.items():
-            if key[-6:-4].isdigit():
-                card, color = key[-6:-4], key[-8:-7]
-                card_number[key] = (card, color, value)
-            else:
-                card, color = key[-5:-4], key[-7:-6]
-                card_number[key] = (card, color, value)
+        card_number = {key: (*TILE_META[key], value) for key, value in PLAYER_2.items() if key in TILE_META}
 
-        odd_sequence = {}
-        even_sequence = {}
+        # Bucket the AI's tiles by parity and color
+        grouped_by_even_seq = defaultdict(list)
+        grouped_by_odd_seq = defaultdict(list)
 
-        for key, values in card_number.items():
-            if int(values[0]) % 2 == 0:
-                even_sequence[key] = values
-            else:
-                odd_sequence[key] = values
-
-        def group_tiles_by_integer(tile_list):
-            grouped_tiles = {}
-
-            for tile in tile_list:
-                integer_value = tile[1][1]
-                if integer_value not in grouped_tiles:
-                    grouped_tiles[integer_value] = []
-                grouped_tiles[integer_value].append(tile)
-
-            for group_key in grouped_tiles:
-                grouped_tiles[group_key] = sorted(grouped_tiles[group_key], key=lambda item: int(item[1][0]))
-
-            return grouped_tiles
-
-        even_sequence_sorted = sorted(even_sequence.items(), key=lambda item: (item[1][1], int(item[1][0])))
-        odd_sequence_sorted = sorted(odd_sequence.items(), key=lambda item: (item[1][1], int(item[1][0])))
-
-        grouped_by_even_seq = group_tiles_by_integer(even_sequence_sorted)
-        grouped_by_odd_seq = group_tiles_by_integer(odd_sequence_sorted)
-
-        def calculate_empty_spaces():
-            empty_spaces = [[coordinate_x, coordinate_y]
-                            for coordinate_x in range(BIG_BOX_POSITION[1], BIG_BOX_POSITION[1] + BIG_BOX_HEIGHT, 73)
-                            for coordinate_y in range(BIG_BOX_POSITION[0], BIG_BOX_POSITION[0] + BIG_BOX_WIDTH, 52)]
-            for o_k, o_v in self.image_database.items():
-                if ("1-15" in o_k and o_v[1][0] in range(BIG_BOX_POSITION[0], BIG_BOX_POSITION[0] + BIG_BOX_WIDTH)
-                        and o_v[1][1] in range(BIG_BOX_POSITION[1], BIG_BOX_POSITION[1] + BIG_BOX_HEIGHT)):
-                    empty_spaces.remove([o_v[1][1], o_v[1][0]])
-
-            return empty_spaces
-
-        empty_space = calculate_empty_spaces()
-        start_position = []
-        count = 0
-        for i in range(len(empty_space) - 1):
-            if empty_space[i][0] == empty_space[i + 1][0] and empty_space[i][1] + 52 == empty_space[i + 1][1]:
-                count += 1
-                start_position.append(empty_space[i])
-                if count == 5:
-                    break
-            else:
-                start_position.clear()
+        for tile in sorted(card_number.items(), key=lambda item: (item[1][1], item[1][0])):
+            grouped_tiles = grouped_by_even_seq if tile[1][0] % 2 == 0 else grouped_by_odd_seq
+            grouped_tiles[tile[1][1]].append(tile)
 
-        if start_position[0][1] != BIG_BOX_POSITION[0]:
-            c_x, c_y = start_position[0][1] + 52, start_position[0][0]
-        else:
-            c_x, c_y = start_position[0][1], start_position[0][0]
+        start_position = find_free_board_position(self.calculate_board_occupancy())
+        if start_position is None:
+            self.add_tile_to_ai()
+            self.update_blit()
+            return
+        c_x, c_y = start_position
 
         c_x_change = 52
 
@@ -709,9 +765,9 @@ class RummikubGame:
                     v[1][2][1].x = c_x
                     v[1][2][1].y = c_y
 
-                    self.game_object_database[v[0]] = v[1][2]
+                    self.set_tile_object(v[0], v[1][2])
                     img = v[1][2]
-                    self.image_database[v[0]] = (img[0], copy.deepcopy([c_x, c_y]), (52, 73), img[1])
+                    self.image_database[v[0]] = (img[0], [c_x, c_y], (52, 73), img[1])
 
                     c_x += c_x_change
 
@@ -725,9 +781,9 @@ class RummikubGame:
                     v[1][2][1].x = c_x
                     v[1][2][1].y = c_y
 
-                    self.game_object_database[v[0]] = v[1][2]
+                    self.set_tile_object(v[0], v[1][2])
                     img = v[1][2]
-                    self.image_database[v[0]] = (img[0], copy.deepcopy([c_x, c_y]), (52, 73), img[1])
+                    self.image_database[v[0]] = (img[0], [c_x, c_y], (52, 73), img[1])
 
                     c_x += c_x_change
                     keys_to_delete.append(v[0])
@@ -757,24 +813,20 @@ class RummikubGame:
         The final result includes lists of tile combinations within the big_box, taking into account adjacency.
         Tiles that do not form combinations are included individually in the result.
         """
-        data_list = {}
-        for key, (tile_surface, tile_position) in self.game_object_database.items():
-            if "1-15" in key:
-                tile_center_x = tile_position.x + tile_position.width // 2
-                tile_center_y = tile_position.y + tile_position.height // 2
+        # Bucket the tiles inside the big box by row
+        rows = defaultdict(list)
+        for key, (tile_surface, tile_position) in self.tiles_1_15.items():
+            tile_center_x = tile_position.x + tile_position.width // 2
+            tile_center_y = tile_position.y + tile_position.height // 2
 
-                if big_box.left <= tile_center_x <= big_box.right and \
-                        big_box.top <= tile_center_y <= big_box.bottom:
-                    data_list[key] = (tile_position.x, tile_position.y)
+            if big_box.left <= tile_center_x <= big_box.right and \
+                    big_box.top <= tile_center_y <= big_box.bottom:
+                rows[tile_position.y].append((key, (tile_position.x, tile_position.y)))
 
         def sort_by_dimensions(item):
             return item[1][1], item[1][0]
 
-        sorted_data = sorted(data_list.items(), key=sort_by_dimensions)
-        dimensions_dict = {}
-        for data_item in sorted_data:
-            dimensions = data_item[1][1]
-            dimensions_dict.setdefault(dimensions, []).append(data_item)
+        dimensions_dict = {row_y: sorted(rows[row_y], key=sort_by_dimensions) for row_y in sorted(rows)}
 
         # Initialize lists to store the final result
         shuffled_combinations = []
@@ -786,61 +838,37 @@ class RummikubGame:
                 shuffled_combinations.append(items)
             else:
                 remaining_items.extend(items)
-        # Sort the final lists
-        shuffled_combinations = [sorted(sublist, key=sort_by_dimensions) for sublist in shuffled_combinations]
-        remaining_items = sorted(remaining_items, key=sort_by_dimensions)
         final_combinations, filtering_list = [], []
 
+        # Split each row into runs of adjacent tiles
         for combination_items in shuffled_combinations:
-            temp_combination = []
-            i, j = 0, 1
-            while j != len(combination_items):
-                first_item = combination_items[i][1]
-                next_item = combination_items[j][1]
-                if (first_item[1] == next_item[1]
-                        and (first_item[0] + 52 == next_item[0] or
-                             first_item[0] - 52 == next_item[0] or
-                             first_item[0] == next_item[0] + 52 or
-                             first_item[0] == next_item[0] - 52)):
-
-                    if combination_items[i] not in temp_combination:
-                        temp_combination.append(combination_items[i])
-                    if combination_items[j] not in temp_combination:
-                        temp_combination.append(combination_items[j])
-
+            current_run = [combination_items[0]]
+            for previous_item, item in zip(combination_items, combination_items[1:]):
+                if item[1][0] - previous_item[1][0] == 52:
+                    current_run.append(item)
                 else:
-                    filtering_list.append(combination_items[i])
-                    filtering_list.append(combination_items[j])
-                    if len(combination_items) >= 2:
-                        final_combinations.append(copy.deepcopy(temp_combination))
-                    temp_combination.clear()
-                i += 1
-                j += 1
-            if len(combination_items) >= 2:
-                final_combinations.append(copy.deepcopy(temp_combination))
-            if i == len(combination_items):
-                break
-        final_combinations_remove_empty_set = [sublist for sublist in final_combinations if sublist]
-
-        def is_filtered():
-            for filer_values in filtering_list:
-                for sub_list in final_combinations_remove_empty_set:
-                    if filer_values in sub_list:
-                        filtering_list.remove(filer_values)
-
-        for i in range(15):
-            is_filtered()
+                    filtering_list.append(previous_item)
+                    filtering_list.append(item)
+                    final_combinations.append(current_run)
+                    current_run = [item]
+            final_combinations.append(current_run)
+        final_combinations_remove_empty_set = [sublist for sublist in final_combinations if len(sublist) >= 2]
+
+        # Drop the non-adjacent tiles that already ended up in a combination
+        placed_keys = {item[0] for sub_list in final_combinations_remove_empty_set for item in sub_list}
+        filtering_list = [filer_values for filer_values in filtering_list if filer_values[0] not in placed_keys]
 
         for filer_val in filtering_list:
             final_combinations_remove_empty_set.append([filer_val])
 
-        remaining_items = [item for i, item in enumerate(remaining_items) if
-                           all(item != remaining_items[j] for j in range(len(remaining_items)) if i != j)]
-
-        for values in final_combinations_remove_empty_set:
-            for value in values:
-                while value in remaining_items:
-                    remaining_items.remove(value)
+        # Keep one entry per remaining tile key
+        seen_keys = {item[0] for sub_list in final_combinations_remove_empty_set for item in sub_list}
+        unique_remaining_items = []
+        for item in remaining_items:
+            if item[0] not in seen_keys:
+                seen_keys.add(item[0])
+                unique_remaining_items.append(item)
+        remaining_items = unique_remaining_items
 
         if len(remaining_items) > 0:
             final_combinations_remove_empty_set.append(remaining_items)
@@ -860,80 +888,42 @@ class RummikubGame:
         If the tiles form a valid sequence or group, their positions are updated in the game_object_database,
         PLAYER_1, PLAYER_2, and image_database. The score is also updated accordingly.
         """
-        prev_item_value, prev_item_color = item_sum[next(iter(item_sum))][0], item_sum[next(iter(item_sum))][1]
-
-        all_same_numbers_satisfied = all(item_value[0] == prev_item_value
-                                         for item_value in item_sum.values())
-        all_different_color_satisfied = all(item_value[1] != prev_item_color
-                                            for index, item_value in enumerate(item_sum.values())
-                                            if index != 0)
-        all_same_color_satisfied = all(item_value[1] == prev_item_color
-                                       for index, item_value in enumerate(item_sum.values())
-                                       if index != 0)
-
-        all_even_numbers_satisfied = True
-        even_values = list(item_sum.values())
-        for i in range(len(even_values) - 1):
-            current_value = int(even_values[i][0])
-            next_value = int(even_values[i + 1][0])
-
-            if current_value % 2 != 0 or (current_value >= next_value and current_value + 2 != next_value):
-                all_even_numbers_satisfied = False
-                break
-
-        if int(even_values[-1][0]) % 2 != 0:
-            all_even_numbers_satisfied = False
+        numbers, colors, _ = zip(*item_sum.values())
+        is_group, is_run = validate_tile_set(numbers, colors)
 
-        all_odd_numbers_satisfied = True
-        odd_values = list(item_sum.values())
-
-        for i in range(len(odd_values) - 1):
-            current_value = int(odd_values[i][0])
-            next_value = int(odd_values[i + 1][0])
-
-            if current_value % 2 == 0 or (current_value >= next_value and current_value + 2 != next_value):
-                all_odd_numbers_satisfied = False
-                break
-
-        if int(odd_values[-1][0]) % 2 == 0:
-            all_odd_numbers_satisfied = False
-
-        if ((all_same_numbers_satisfied and all_different_color_satisfied) or
-                (all_same_color_satisfied and all_even_numbers_satisfied or all_odd_numbers_satisfied)):
+        if is_group or is_run:
             for index, (item_key, item_value) in enumerate(item_sum.items()):
-                if item_key in self.game_object_database.keys():
-                    if item_key in PLAYER_1.keys():
+                if item_key in self.game_object_database:
+                    if item_key in PLAYER_1:
                         PLAYER_1[item_key][1][0], PLAYER_1[item_key][1][1] = item_value[2][0], item_value[2][1]
-                    if item_key in PLAYER_2.keys():
+                    if item_key in PLAYER_2:
                         PLAYER_2[item_key][1][0], PLAYER_2[item_key][1][1] = item_value[2][0], item_value[2][1]
-                    (self.game_object_database[item_key][1][0],
-                     self.game_object_database[item_key][1][1],
-                     self.image_database[item_key][3][0],
-                     self.image_database[item_key][3][1],
-                     self.image_database[item_key][1][0],
-                     self.image_database[item_key][1][1]) = (item_value[2][0], item_value[2][1],
-                                                             item_value[2][0], item_value[2][1],
-                                                             item_value[2][0], item_value[2][1])
-                    update_score((self.game_object_database["brown_rack_image_tile2"][1][2],
-                                  self.game_object_database["brown_rack_image_tile2"][1][3]),
-                                 (self.game_object_database["brown_rack_image_tile2"][1]))
+                    position_x, position_y = item_value[2]
+                    tile_position = self.game_object_database[item_key][1]
+                    tile_position.x, tile_position.y = position_x, position_y
+                    self.image_database[item_key][1][0], self.image_database[item_key][1][1] = position_x, position_y
+            self.hover_zones_cache = None
+            rack_rect = self.game_object_database["brown_rack_image_tile2"][1]
+            update_score((rack_rect[2], rack_rect[3]), rack_rect)
             return True
         else:
-            for key, value in self.game_object_database.items():
-                if "images/tiles/1-15" in key:
-                    (self.game_object_database[key][1][0],
-                     self.game_object_database[key][1][1]) = (self.image_database[key][1][0],
-                                                              self.image_database[key][1][1])
-                if key in PLAYER_1.items():
-                    (PLAYER_1[key][1][0],
-                     PLAYER_1[key][1][1]) = (self.game_object_database[key][1][0],
-                                             self.game_object_database[key][1][1])
-                if key in PLAYER_2.items():
-                    (PLAYER_2[key][1][0],
-                     PLAYER_2[key][1][1]) = (self.game_object_database[key][1][0],
-                                             self.game_object_database[key][1][1])
+            self.reset_board_tiles()
             return False
 
+    def reset_board_tiles(self):
+        """
+        Move every tile back to its last confirmed position stored in image_database.
+
+        The positions held in PLAYER_1 and PLAYER_2 are synced with the restored ones.
+        """
+        for key, (tile_surface, tile_position) in self.tiles_1_15.items():
+            position_x, position_y = self.image_database[key][1]
+            tile_position.x, tile_position.y = position_x, position_y
+            if key in PLAYER_1:
+                PLAYER_1[key][1].x, PLAYER_1[key][1].y = position_x, position_y
+            if key in PLAYER_2:
+                PLAYER_2[key][1].x, PLAYER_2[key][1].y = position_x, position_y
+
     def check_logic(self):
         """
         Check the logic of tile placement on the game board.
@@ -950,50 +940,22 @@ class RummikubGame:
                 if all(len(perm_value) in range(3, 6) for perm_value in permutation_values):
                     card_number.clear()
                     for key, value in perm_values:
-                        if key[-6:-4].isdigit():
-                            card, color = key[-6:-4], key[-8:-7]
-                            card_number[key] = (card, color, value)
-                        else:
-                            card, color = key[-5:-4], key[-7:-6]
-                            card_number[key] = (card, color, value)
+                        card, color = TILE_META[key]
+                        card_number[key] = (card, color, value)
                     if card_number not in check_sum:
-                        check_sum.append(copy.deepcopy(card_number))
+                        check_sum.append(card_number.copy())
                 else:
-                    for key, value in self.game_object_database.items():
-                        if "images/tiles/1-15" in key:
-                            (self.game_object_database[key][1][0],
-                             self.game_object_database[key][1][1]) = (self.image_database[key][1][0],
-                                                                      self.image_database[key][1][1])
-                        if key in PLAYER_1.items():
-                            (PLAYER_1[key][1][0],
-                             PLAYER_1[key][1][1]) = (self.game_object_database[key][1][0],
-                                                     self.game_object_database[key][1][1])
-                        if key in PLAYER_2.items():
-                            (PLAYER_2[key][1][0],
-                             PLAYER_2[key][1][1]) = (self.game_object_database[key][1][0],
-                                                     self.game_object_database[key][1][1])
+                    self.reset_board_tiles()
             status = []
             for check in check_sum:
                 status.append(self.update_values(check))
             if all(status):
                 self.play_ai_turn(True)
         else:
-            for key, value in self.game_object_database.items():
-                if "images/tiles/1-15" in key:
-                    (self.game_object_database[key][1][0],
-                     self.game_object_database[key][1][1]) = (self.image_database[key][1][0],
-                                                              self.image_database[key][1][1])
-                if key in PLAYER_1.items():
-                    (PLAYER_1[key][1][0],
-                     PLAYER_1[key][1][1]) = (self.game_object_database[key][1][0],
-                                             self.game_object_database[key][1][1])
-                if key in PLAYER_2.items():
-                    (PLAYER_2[key][1][0],
-                     PLAYER_2[key][1][1]) = (self.game_object_database[key][1][0],
-                                             self.game_object_database[key][1][1])
+            self.reset_board_tiles()
         self.update_blit()
 
-    def move_tiles(self, mouse_position, key_list, value_list):
+    def move_tiles(self, mouse_position, key_list, value_list, tile_rects=None):
         """
         Move and snap tiles based on mouse input.
 
@@ -1001,6 +963,10 @@ class RummikubGame:
         - mouse_position (tuple): The current position of the mouse (x, y).
         - key_list (list): List of keys corresponding to the tiles to be moved.
         - value_list (list): List of values corresponding to the tiles.
+        - tile_rects (list): The rect objects of the tiles, in the same order as key_list. Built if not given.
+
+        Returns:
+        bool: True if a tile was under the mouse and has been moved, False otherwise.
 
         This function handles the dragging and snapping of tiles based on mouse input.
         It updates the tile position as the mouse moves and snaps the tile to the grid upon release.
@@ -1009,99 +975,119 @@ class RummikubGame:
 
         """
         mouse_x, mouse_y = mouse_position
+        if tile_rects is None:
+            tile_rects = [self.game_object_database[key][1] for key in key_list]
+
+        # Find the tile under the cursor
+        hit_index = pygame.Rect(mouse_position, (1, 1)).collidelist(tile_rects)
+        if hit_index == -1:
+            return False
+
+        key, value = key_list[hit_index], value_list[hit_index]
+        tile_surface, tile_position = self.game_object_database[key]
+
+        # Calculate the offset from the center of the tile
+        offset_x = mouse_x - (tile_position.x + tile_position.width // 2)
+        offset_y = mouse_y - (tile_position.y + tile_position.height // 2)
+
+        dragging = True
+        while dragging:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.event.post(event)
+                    return True
+                elif event.type == pygame.MOUSEMOTION:
+                    mouse_x, mouse_y = event.pos
+                    prev_rect = tile_position.copy()
+                    # Update the tile position based on the mouse movement
+                    tile_position.x = mouse_x - offset_x - tile_position.width // 2
+                    tile_position.y = mouse_y - offset_y - tile_position.height // 2
+
+                    # Redraw only the area the tile left and entered
+                    dirty_rect = prev_rect.union(tile_position)
+                    self.redraw_area(dirty_rect)
+                    pygame.display.update(dirty_rect)
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    dragging = False
+
+                    # Snap the tile to the grid
+                    snapped_rect, status = snap_to_grid(tile_position, GRID_WIDTH, GRID_HEIGHT, BIG_BOX,
+                                                        value[1])
+                    if status:
+                        if (snapped_rect[0], snapped_rect[1]) not in (CURRENT_POSITION, value[1]):
+                            CURRENT_POSITION[key] = (snapped_rect[0], snapped_rect[1])
 
-        for key, value in zip(key_list, value_list):
-            tile_surface, tile_position = self.game_object_database[key]
-            if tile_position.collidepoint(mouse_x, mouse_y):
-
-                # Calculate the offset from the center of the tile
-                offset_x = mouse_x - (tile_position.x + tile_position.width // 2)
-                offset_y = mouse_y - (tile_position.y + tile_position.height // 2)
-
-                dragging = True
-                while dragging:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            pygame.quit()
-                            sys.exit()
-                        elif event.type == pygame.MOUSEMOTION:
-                            mouse_x, mouse_y = event.pos
-                            # Update the tile position based on the mouse movement
-                            tile_position.x = mouse_x - offset_x - tile_position.width // 2
-                            tile_position.y = mouse_y - offset_y - tile_position.height // 2
-
-                            # Draw grids while dragging
-                            draw_3d_grid(self.display_surface, GRID_WIDTH, GRID_HEIGHT, BIG_BOX)
-
-                            pygame.display.flip()
-                        elif event.type == pygame.MOUSEBUTTONUP:
-                            dragging = False
-
-                            # Snap the tile to the grid
-                            snapped_rect, status = snap_to_grid(tile_position, GRID_WIDTH, GRID_HEIGHT, BIG_BOX,
-                                                                value[1])
-                            if status:
-                                if (snapped_rect[0], snapped_rect[1]) not in (CURRENT_POSITION, value[1]):
-                                    CURRENT_POSITION[key] = (snapped_rect[0], snapped_rect[1])
-
-                            tile_position.x, tile_position.y = snapped_rect.x, snapped_rect.y
-
-                            if all(CURRENT_POSITION[k][0] == PLAYER_1[k][1][0] and
-                                   CURRENT_POSITION[k][1] == PLAYER_1[k][1][1]
-                                   for k, v in self.game_object_database.items()
-                                   if "1-15" in k and k in CURRENT_POSITION.keys() and k in PLAYER_1.keys()):
-                                CURRENT_POSITION.clear()
-                            if all(CURRENT_POSITION[k][0] == PLAYER_2[k][1][0] and
-                                   CURRENT_POSITION[k][1] == PLAYER_2[k][1][1]
-                                   for k, v in self.game_object_database.items()
-                                   if "1-15" in k and k in CURRENT_POSITION.keys() and k in PLAYER_2.keys()):
-                                CURRENT_POSITION.clear()
-                            self.update_blit()
-
-                            draw_3d_grid(self.display_surface, GRID_WIDTH, GRID_HEIGHT, BIG_BOX)
-
-                            pygame.display.flip()
-
-        pygame.display.update()
+                    tile_position.x, tile_position.y = snapped_rect.x, snapped_rect.y
+
+                    if all(CURRENT_POSITION[k] == tuple(PLAYER_1[k][1][:2])
+                           for k in CURRENT_POSITION if k in PLAYER_1):
+                        CURRENT_POSITION.clear()
+                    if all(CURRENT_POSITION[k] == tuple(PLAYER_2[k][1][:2])
+                           for k in CURRENT_POSITION if k in PLAYER_2):
+                        CURRENT_POSITION.clear()
+                    self.update_blit(False)
+
+                    draw_3d_grid(self.display_surface, GRID_WIDTH, GRID_HEIGHT, BIG_BOX)
+
+                    pygame.display.flip()
+
+            self.clock.tick(FRAME_RATE)
+
+        return True
+
+    def redraw_area(self, area: Rect) -> None:
+        """
+        Redraw the game objects and the board grid inside a part of the display surface.
+
+        Parameters:
+        - area (Rect): The region of the display surface to redraw.
+
+        Returns:
+        None
+
+        The display surface is clipped to the area while drawing, so only its pixels are touched.
+        """
+        self.display_surface.set_clip(area)
+        self.draw_game_objects()
+        draw_3d_grid(self.display_surface, GRID_WIDTH, GRID_HEIGHT, BIG_BOX)
+        self.display_surface.set_clip(None)
+
+    def draw_game_objects(self) -> dict:
+        """
+        Draw the static background and the tiles on the display surface.
+
+        Returns:
+        dict: A dictionary containing the rect objects of various elements.
+
+        The blit sequence is cached until set_tile_object or set_game_object store an object again.
+        """
+        if self.blit_cache is None:
+            self.blit_cache = ([(self.static_background, (0, 0))] +
+                               [(value[0], value[1]) for value in self.tiles_1_15.values()],
+                               {key: value[1] for key, value in self.game_object_database.items()})
+        blit_sequence, display_object = self.blit_cache
+        # fblits is only available on pygame-ce
+        if hasattr(self.display_surface, "fblits"):
+            self.display_surface.fblits(blit_sequence)
+        else:
+            self.display_surface.blits(blit_sequence, doreturn=False)
+        return display_object
 
     def play_for_me(self):
         groups = identify_rummikub_groups(PLAYER_1)
         runs = identify_rummikub_runs(PLAYER_1)
 
-        def calculate_empty_spaces():
-            empty_spaces = [[coordinate_x, coordinate_y]
-                            for coordinate_x in range(BIG_BOX_POSITION[1], BIG_BOX_POSITION[1] + BIG_BOX_HEIGHT, 73)
-                            for coordinate_y in range(BIG_BOX_POSITION[0], BIG_BOX_POSITION[0] + BIG_BOX_WIDTH, 52)]
-            for o_k, o_v in self.image_database.items():
-                if ("1-15" in o_k and o_v[1][0] in range(BIG_BOX_POSITION[0], BIG_BOX_POSITION[0] + BIG_BOX_WIDTH)
-                        and o_v[1][1] in range(BIG_BOX_POSITION[1], BIG_BOX_POSITION[1] + BIG_BOX_HEIGHT)):
-                    empty_spaces.remove([o_v[1][1], o_v[1][0]])
-
-            return empty_spaces
-
-        empty_space = calculate_empty_spaces()
-        start_position = []
-        count = 0
-        for i in range(len(empty_space) - 1):
-            if empty_space[i][0] == empty_space[i + 1][0] and empty_space[i][1] + 52 == empty_space[i + 1][1]:
-                count += 1
-                start_position.append(empty_space[i])
-                if count == 5:
-                    break
-            else:
-                start_position.clear()
-        if start_position[0][1] != BIG_BOX_POSITION[0]:
-            c_x, c_y = start_position[0][1] + 52, start_position[0][0]
-        else:
-            c_x, c_y = start_position[0][1], start_position[0][0]
+        start_position = find_free_board_position(self.calculate_board_occupancy())
+        if start_position is None:
+            return
+        c_x, c_y = start_position
 
         def set_tile_position(key, pos_x, pos_y):
             self.game_object_database[key][1].x = pos_x
-            self.image_database[key][3].x = pos_x
             self.image_database[key][1][0] = pos_x
             self.game_object_database[key][1].y = pos_y
-            self.image_database[key][3].y = pos_y
             self.image_database[key][1][1] = pos_y
+            self.hover_zones_cache = None
             del PLAYER_1[key]
 
         for group in groups:
@@ -1134,35 +1120,34 @@ class RummikubGame:
         bool: False if the display is closed.
         """
         show_cards = True
+        clock = pygame.time.Clock()
 
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    pygame.event.post(event)
+                    return False
                 elif event.type == pygame.MOUSEBUTTONUP:
                     show_cards = not show_cards
 
             if show_cards:
 
                 c_x, c_y = 350, WINDOW_HEIGHT - 210
-                font = pygame.font.Font(FONT_PATH, 36)
-                text = font.render("PLAYER 2 :=", True, (255, 255, 255))
-                rect = text.get_rect()
-                rect.x, rect.y = 50, WINDOW_HEIGHT - 200
+                blit_sequence = [(self.player_2_label, self.player_2_label_rect)]
 
                 for ai_key, ai_cards in PLAYER_2.items():
                     ai_cards[1].x = c_x
                     ai_cards[1].y = c_y
-                    self.display_surface.blit(ai_cards[0], ai_cards[1])
-                    self.display_surface.blit(text, rect)
+                    blit_sequence.append((ai_cards[0], ai_cards[1]))
                     c_x += ai_cards[0].get_width() + 5
                     if c_x > WINDOW_WIDTH:
                         c_x = WINDOW_WIDTH + 5
                         c_y += ai_cards[0].get_height() + 5
+                self.display_surface.blits(blit_sequence, doreturn=False)
                 return False
 
             pygame.display.flip()
+            clock.tick(FRAME_RATE)
 
     def menu_function(self):
         """
@@ -1192,33 +1177,36 @@ class RummikubGame:
 
         self.set_image_transparency((0, 0, 0, 150), (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
 
-        font = pygame.font.Font(FONT_PATH, 36)
-        y_offset = 100
-        selected_menu = {}
+        # Render the options once
+        if self.menu_cache is None:
+            y_offset = 100
+            self.menu_cache = {}
+
+            for option in menu_options:
+                text = self.ui_font.render(option, True, (255, 255, 255))
+                rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
+                self.menu_cache[option] = (text, rect)
+                y_offset += 40
 
-        for option in menu_options:
-            text = font.render(option, True, (255, 255, 255))
-            rect = text.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-            selected_menu[option] = rect  # Store only the Rect object
-            self.display_surface.blit(text, rect)
-            y_offset += 40
+        selected_menu = {option: rect for option, (text, rect) in self.menu_cache.items()}
+        self.display_surface.blits(list(self.menu_cache.values()), doreturn=False)
 
         pygame.display.flip()
 
         while True:
-            for event in pygame.event.get():
+            for event in [pygame.event.wait()] + pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    pygame.event.post(event)
+                    return False
                 elif event.type == pygame.MOUSEBUTTONUP:
-                    position = pygame.mouse.get_pos()
+                    position = event.pos
                     for k, rect in selected_menu.items():
                         if rect.collidepoint(position):
                             if k == "3. Close Menu":
                                 return False
                             elif k == "4. Exit Game":
-                                pygame.quit()
-                                sys.exit()
+                                pygame.event.post(pygame.event.Event(pygame.QUIT))
+                                return False
                             elif k == "2. Show AI Cards":
                                 while True:
                                     status = self.show_computer_cards()
@@ -1229,21 +1217,23 @@ class RummikubGame:
                                 self.play_for_me()
                                 return False
 
-    def handle_mouse_motion(self, value: dict, color: Tuple[int, int, int, int] = (36, 160, 237, 30),
-                            mouse=False) -> None:
+    def handle_mouse_motion(self, value: dict, color: Tuple[int, int, int, int] = HOVER_COLOR,
+                            mouse=False, position: Tuple[int, int] = None) -> list:
         """
         Handle mouse motion events.
 
         Parameters:
         - value (dict): A dictionary containing rect objects of various elements.
         - color (Tuple[int, int, int, int]): The color of the transparent rectangle.
+        - position (Tuple[int, int]): The mouse position carried by the event, read from the mouse if not given.
 
         Returns:
-        None
+        list: The rects of the display surface covered by a highlight, to be pushed to the screen.
         """
-        position = pygame.mouse.get_pos()
+        if position is None:
+            position = pygame.mouse.get_pos()
+        dirty_rects = []
         for k, val in value.items():
-            flag = False
             if value["add_cards"] == val and val.collidepoint(position) and mouse:
                 self.add_tile_to_rack(self.get_game_object()[0]["brown_rack_image_tile2"])
             elif value["check_logic_button"] == val and val.collidepoint(position) and mouse:
@@ -1272,45 +1262,66 @@ class RummikubGame:
                     self.rearrange_tiles_by_runs(runs)
 
             if val.collidepoint(position):
-                rearrange_button_path = IMG_PATHS[1]
-                for i, img_path in enumerate(IMG_PATHS):
-                    x_top_axis, y_top_axis, x_bottom_axis, y_bottom_axis = (
-                        self.image_database[img_path][1][0],
-                        self.image_database[img_path][1][1],
-                        (self.image_database[img_path][1][0] + self.image_database[img_path][2][0]),
-                        (self.image_database[img_path][1][1] + self.image_database[img_path][2][1])
-                    )
-
-                    if (position[0] in range(x_top_axis, x_bottom_axis) and
-                            position[1] in range(y_top_axis, y_bottom_axis)):
-
-                        if img_path == rearrange_button_path:
-                            if position[1] in range(y_top_axis, (y_bottom_axis + y_top_axis) // 2):
-                                self.set_image_transparency(color, (x_top_axis, y_top_axis,
-                                                                    x_bottom_axis - x_top_axis,
-                                                                    (y_bottom_axis - y_top_axis) // 2))
-
-                            else:
-                                self.set_image_transparency(color, (x_top_axis, y_top_axis * 2 - 40,
-                                                                    x_bottom_axis - x_top_axis,
-                                                                    (y_bottom_axis - y_top_axis) // 2))
-                            flag = True
-                            break
-                        else:
-                            self.set_image_transparency(color, (x_top_axis, y_top_axis,
-                                                                x_bottom_axis - x_top_axis,
-                                                                y_bottom_axis - y_top_axis))
-
-                            flag = True
-                            break
-
-                if flag:
+                dirty_rects.extend(self.highlight_hovered_image(position, color))
+                if dirty_rects or not mouse:
                     break
 
-    def update_blit(self) -> dict:
+        return dirty_rects
+
+    def highlight_hovered_image(self, position: Tuple[int, int], color: Tuple[int, int, int, int]) -> list:
+        """
+        Highlight the button or tile image under the mouse.
+
+        Parameters:
+        - position (Tuple[int, int]): The mouse position.
+        - color (Tuple[int, int, int, int]): The color of the transparent rectangle.
+
+        Returns:
+        list: The rect of the highlight drawn on the display surface, or an empty list if nothing is hovered.
+        """
+        zone_paths, zone_rects = self.get_hover_zones()
+        zone_index = pygame.Rect(position, (1, 1)).collidelist(zone_rects)
+        if zone_index == -1:
+            return []
+
+        x_top_axis, y_top_axis, width, height = zone_rects[zone_index]
+        x_bottom_axis, y_bottom_axis = x_top_axis + width, y_top_axis + height
+
+        if zone_paths[zone_index] == REARRANGE_TILES_ICON_PATH:
+            if y_top_axis <= position[1] < (y_bottom_axis + y_top_axis) // 2:
+                return [self.set_image_transparency(color, (x_top_axis, y_top_axis,
+                                                            x_bottom_axis - x_top_axis,
+                                                            (y_bottom_axis - y_top_axis) // 2))]
+            return [self.set_image_transparency(color, (x_top_axis, y_top_axis * 2 - 40,
+                                                        x_bottom_axis - x_top_axis,
+                                                        (y_bottom_axis - y_top_axis) // 2))]
+        return [self.set_image_transparency(color, (x_top_axis, y_top_axis,
+                                                    x_bottom_axis - x_top_axis,
+                                                    y_bottom_axis - y_top_axis))]
+
+    def get_hover_zones(self):
+        """
+        Get the areas of the images that are highlighted when the mouse is over them.
+
+        Returns:
+        tuple: A list of image paths from IMG_PATHS and a list of their rect objects, in the same order.
+
+        The zones are built from the stored image_database positions and cached until an image is stored or moved.
+        """
+        if self.hover_zones_cache is None:
+            zone_paths = list(IMG_PATHS)
+            zone_rects = [pygame.Rect(self.image_database[img_path][1], self.image_database[img_path][2])
+                          for img_path in zone_paths]
+            self.hover_zones_cache = zone_paths, zone_rects
+        return self.hover_zones_cache
+
+    def update_blit(self, flip: bool = True) -> dict:
         """
         Update and blit the elements on the display surface.
 
+        Parameters:
+        - flip (bool): Whether to push the finished frame to the screen.
+
         Returns:
         dict: A dictionary containing the rect objects of various elements.
         """
@@ -1331,16 +1342,76 @@ class RummikubGame:
             self.set_image_transparency((0, 0, 0, 50), (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
 
         if not game_over:
-            for key, value in self.game_object_database.items():
-                self.display_surface.blit(value[0], value[1])
-                display_object[key] = value[1]
+            display_object = self.draw_game_objects()
 
         pygame.draw.line(self.display_surface, LINE_COLOR, (0, WINDOW_HEIGHT),
                          (WINDOW_WIDTH, WINDOW_HEIGHT), 20)
-        pygame.display.flip()
+        if flip:
+            pygame.display.flip()
 
         return display_object
 
+    def handle_quit_event(self, event, value: dict) -> list:
+        """
+        Stop the game loop so game_status can close the window and return.
+
+        Parameters:
+        - event (pygame.event.Event): The QUIT event.
+        - value (dict): A dictionary containing rect objects of various elements.
+
+        Returns:
+        list: An empty list, nothing is drawn.
+        """
+        self.running = False
+        return []
+
+    def handle_expose_event(self, event, value: dict) -> list:
+        """
+        Schedule a redraw of the board after the window content was invalidated.
+
+        Parameters:
+        - event (pygame.event.Event): The expose, restore or shown event.
+        - value (dict): A dictionary containing rect objects of various elements.
+
+        Returns:
+        list: An empty list, nothing is drawn.
+        """
+        self.needs_redraw = True
+        return []
+
+    def handle_click_event(self, event, value: dict) -> list:
+        """
+        Move the clicked tile and trigger the button under the mouse.
+
+        Parameters:
+        - event (pygame.event.Event): The MOUSEBUTTONUP event.
+        - value (dict): A dictionary containing rect objects of various elements.
+
+        Returns:
+        list: The rects of the display surface that changed and still have to be pushed to the screen.
+        """
+        KEYS_LIST, VALUE_LIST, RECT_LIST = self.get_tile_lists()
+        self.needs_redraw = True
+        if self.move_tiles(event.pos, KEYS_LIST, VALUE_LIST, RECT_LIST):
+            return []
+        return self.handle_mouse_motion(value, CLICK_HIGHLIGHT_COLOR, True, event.pos)
+
+    def handle_motion_event(self, event, value: dict) -> list:
+        """
+        Highlight the button under the mouse.
+
+        Parameters:
+        - event (pygame.event.Event): The MOUSEMOTION event.
+        - value (dict): A dictionary containing rect objects of various elements.
+
+        Returns:
+        list: The rects of the display surface that changed and still have to be pushed to the screen.
+        """
+        if self.highlight_rects:
+            self.update_blit()
+        self.highlight_rects = self.handle_mouse_motion(value, position=event.pos)
+        return self.highlight_rects
+
     def game_status(self):
         """
         Main function to manage the game status and events.
@@ -1349,28 +1420,50 @@ class RummikubGame:
         str: The status of the game (e.g., "Exit").
         """
         self.initialize_window()
-        status, running = None, True
+        # Only queue the events the game handles
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.VIDEOEXPOSE,
+                                  pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN])
+        self.running = True
 
         self.set_game_object()
 
         PLAYERS_DB = self.draw_initial_tiles(TILES_IMAGES_PATHS, PLAYERS)
-        self.place_initial_tiles([PLAYERS_DB[0]], self.get_game_object()[0]["brown_rack_image_tile2"],
-                                 self.get_game_object()[1]["brown_rack_image_tile2"])
+        size, coordinates, _ = self.get_game_object()
+        self.place_initial_tiles([PLAYERS_DB[0]], size["brown_rack_image_tile2"],
+                                 coordinates["brown_rack_image_tile2"])
+
+        update_blit = self.update_blit
+        wait_event = pygame.event.wait
+        get_events = pygame.event.get
+        get_handler = self.event_dispatch.get
+        update_display = pygame.display.update
+        tick = self.clock.tick
+        mouse_motion = pygame.MOUSEMOTION
+
+        while self.running:
+            if self.needs_redraw:
+                value = update_blit()
+                self.needs_redraw = False
+                self.highlight_rects = []
+
+            dirty_rects = []
+            events = [wait_event()] + get_events()
+            # Only handle the last mouse motion
+            last_motion = next((event for event in reversed(events) if event.type == mouse_motion), None)
+            for event in events:
+                if event.type == mouse_motion and event is not last_motion:
+                    continue
+                handler = get_handler(event.type)
+                if handler is not None:
+                    dirty_rects.extend(handler(event, value))
+                if not self.running:
+                    break
 
-        while running:
-            value = self.update_blit()
+            if dirty_rects and self.running:
+                update_display(dirty_rects)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONUP:
-                    KEYS_LIST = [k for k, v in self.game_object_database.items() if
-                                 "brown_rack_image_tile" not in k and "tile" in k]
-                    VALUE_LIST = [v for k, v in self.image_database.items() if "1-15" in k]
-                    self.move_tiles(pygame.mouse.get_pos(), KEYS_LIST, VALUE_LIST)
-                    self.handle_mouse_motion(value, (36, 160, 237, 120), True)
-                if event.type == pygame.MOUSEMOTION:
-                    self.handle_mouse_motion(value)
+            tick(FRAME_RATE)
 
-            pygame.display.flip()
+        pygame.display.quit()
+        return "Exit"
@@ -1,9 +1,11 @@
+from typing import NamedTuple, Tuple
+
 import pygame
 
 
-class SurfaceInfo:
+class SurfaceInfo(NamedTuple):
     """
-    A class to store information about a surface.
+    A lightweight immutable record to store information about a surface.
 
     Attributes:
     - image_path (str): The path to the image file.
@@ -11,10 +13,9 @@ class SurfaceInfo:
     - size (Tuple[int, int]): The size of the image.
     """
 
-    def __init__(self, image_path, coordinates, size):
-        self.image_path = image_path
-        self.coordinates = coordinates
-        self.size = size
+    image_path: str
+    coordinates: Tuple[int, int]
+    size: Tuple[int, int]
 
 
 def recreate_surface(surface_info):
@@ -27,7 +28,7 @@ def recreate_surface(surface_info):
     Returns:
     Tuple[pygame.Surface, pygame.Rect]: A tuple containing the resized surface and its rect object.
     """
-    loaded_image = pygame.image.load(surface_info.image_path)
+    loaded_image = pygame.image.load(surface_info.image_path).convert_alpha()
     bg_img_rect = loaded_image.get_rect()
     bg_img_rect.topleft = surface_info.coordinates
     resized_image = pygame.transform.scale(loaded_image, surface_info.size)